@@ -1,6 +1,7 @@
 """
 文件管理相关API路由
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from typing import List
 
@@ -16,7 +17,8 @@ def create_file_router(file_service: FileManagementService):
     async def list_files():
         """获取输入目录中的所有媒体文件"""
         try:
-            files = file_service.list_input_files()
+            # 目录扫描在线程中执行，避免慢速存储阻塞事件循环
+            files = await asyncio.to_thread(file_service.list_input_files)
             if len(files) == 0:
                 return {"files": [], "input_dir": file_service.input_dir, "message": "input 目录中没有找到支持的媒体文件"}
             return {"files": files, "input_dir": file_service.input_dir}
@@ -4,16 +4,20 @@
 import os
 import uuid
 import shutil
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+import asyncio
+import logging
+from typing import Tuple
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response, UploadFile, File, Form
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
-import json
 
 from models.job_models import JobSettings, JobState
 from services.transcription_service import TranscriptionService
-from services.file_service import FileManagementService
+from services.file_service import FileManagementService, mirror_to_output, stat_or_none
 
 router = APIRouter(prefix="/api", tags=["transcription"])
+logger = logging.getLogger(__name__)
 
 
 class TranscribeSettings(BaseModel):
@@ -25,6 +29,12 @@ class TranscribeSettings(BaseModel):
     word_timestamps: bool = False
 
 
+def _job_body_and_etag(job: JobState) -> Tuple[bytes, str]:
+    """序列化任务状态，并由响应体生成弱 ETag，ETag 与 to_dict 的内容始终一致"""
+    body = orjson.dumps(job.to_dict())
+    return body, f'W/"{hash(body) & 0xffffffffffffffff:x}"'
+
+
 class UploadResponse(BaseModel):
     """上传响应模型"""
     job_id: str
@@ -51,27 +61,17 @@ def create_transcription_router(
             # 保存用户原始文件路径信息
             original_filename = file.filename
             
-            # 将文件保存到input目录
-            input_path = file_service.get_input_file_path(original_filename)
-            
-            # 如果同名文件已存在，添加时间戳
-            counter = 1
-            base_name, ext = os.path.splitext(original_filename)
-            while os.path.exists(input_path):
-                new_filename = f"{base_name}_{counter}{ext}"
-                input_path = file_service.get_input_file_path(new_filename)
-                original_filename = new_filename
-                counter += 1
-            
-            # 保存文件
-            with open(input_path, "wb") as buffer:
-                content = await file.read()
-                buffer.write(content)
+            # 保存文件（同名自动加序号）
+            original_filename, input_path = await asyncio.to_thread(
+                file_service.save_input_file, file.file, original_filename
+            )
             
             # 创建转录任务
             job_id = uuid.uuid4().hex
             settings = JobSettings()
-            transcription_service.create_job(original_filename, input_path, settings, job_id=job_id)
+            await asyncio.to_thread(
+                transcription_service.create_job, original_filename, input_path, settings, job_id=job_id
+            )
             
             return {
                 "job_id": job_id, 
@@ -89,7 +89,7 @@ def create_transcription_router(
         """为指定文件创建转录任务（本地input模式）"""
         try:
             input_path = file_service.get_input_file_path(filename)
-            if not os.path.exists(input_path):
+            if not await asyncio.to_thread(os.path.exists, input_path):
                 raise HTTPException(status_code=404, detail="文件不存在")
             
             if not file_service.is_supported_file(filename):
@@ -97,7 +97,7 @@ def create_transcription_router(
             
             job_id = uuid.uuid4().hex
             settings = JobSettings()
-            transcription_service.create_job(filename, input_path, settings, job_id=job_id)
+            await asyncio.to_thread(transcription_service.create_job, filename, input_path, settings, job_id=job_id)
             
             return {"job_id": job_id, "filename": filename}
         except HTTPException:
@@ -109,13 +109,14 @@ def create_transcription_router(
     async def start_job(job_id: str = Form(...), settings: str = Form(...)):
         """启动转录任务"""
         try:
-            settings_obj = TranscribeSettings(**json.loads(settings))
+            # 由 pydantic-core 一次完成 JSON 解析与校验
+            settings_obj = TranscribeSettings.model_validate_json(settings)
             job = transcription_service.get_job(job_id)
             if not job:
                 raise HTTPException(status_code=404, detail="无效 job_id")
             
             # 覆盖设置
-            job.settings = JobSettings(**settings_obj.dict())
+            job.settings = JobSettings(**settings_obj.model_dump())
             transcription_service.start_job(job_id)
             return {"job_id": job_id, "started": True}
         except HTTPException:
@@ -134,21 +135,28 @@ def create_transcription_router(
         return {"job_id": job_id, "canceled": ok}
 
     @router.get("/status/{job_id}")
-    async def get_job_status(job_id: str):
+    async def get_job_status(job_id: str, request: Request):
         """获取任务状态"""
         job = transcription_service.get_job(job_id)
         if not job:
             raise HTTPException(status_code=404, detail="任务未找到")
-        return job.to_dict()
+        
+        # 状态未变化时返回 304，省去轮询时的传输
+        body, etag = _job_body_and_etag(job)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
     @router.get("/download/{job_id}")
-    async def download_result(job_id: str, copy_to_source: bool = False):
+    async def download_result(job_id: str, background_tasks: BackgroundTasks, copy_to_source: bool = False):
         """下载转录结果"""
         job = transcription_service.get_job(job_id)
         if not job:
             raise HTTPException(status_code=404, detail="任务未找到")
         
-        if not job.srt_path or not os.path.exists(job.srt_path):
+        # stat 结果交给 FileResponse 复用
+        srt_stat = await asyncio.to_thread(stat_or_none, job.srt_path) if job.srt_path else None
+        if srt_stat is None:
             raise HTTPException(status_code=404, detail="字幕文件未生成")
         
         filename = os.path.basename(job.srt_path)
@@ -159,29 +167,22 @@ def create_transcription_router(
             source_srt_path = os.path.join(source_dir, filename)
             
             try:
-                shutil.copy2(job.srt_path, source_srt_path)
-                print(f"SRT文件已复制到源目录: {source_srt_path}")
+                await asyncio.to_thread(shutil.copy2, job.srt_path, source_srt_path)
+                logger.info("SRT文件已复制到源目录: %s", source_srt_path)
             except Exception as e:
-                print(f"复制到源目录失败: {e}")
+                logger.warning("复制到源目录失败: %s", e)
         
-        # 同时复制到输出目录
+        # 输出目录的副本改为响应后在后台生成，直接返回任务目录中的原文件
+        # 每次下载都同步：已是最新副本时 link_or_copy 直接跳过，旧任务留下的同名过期副本也会被更新
         output_path = os.path.join(output_dir, filename)
-        try:
-            if not os.path.exists(output_path):
-                shutil.copy2(job.srt_path, output_path)
-            
-            return FileResponse(
-                path=output_path, 
-                filename=filename, 
-                media_type='text/plain; charset=utf-8'
-            )
-        except Exception as e:
-            # 如果复制失败，直接返回原文件
-            return FileResponse(
-                path=job.srt_path, 
-                filename=filename, 
-                media_type='text/plain; charset=utf-8'
-            )
+        background_tasks.add_task(mirror_to_output, job.srt_path, output_path)
+        
+        return FileResponse(
+            path=job.srt_path, 
+            filename=filename, 
+            media_type='text/plain; charset=utf-8',
+            stat_result=srt_stat
+        )
 
     @router.post("/copy-result/{job_id}")
     async def copy_result_to_source(job_id: str):
@@ -190,7 +191,7 @@ def create_transcription_router(
         if not job:
             raise HTTPException(status_code=404, detail="任务未找到")
         
-        if not job.srt_path or not os.path.exists(job.srt_path):
+        if not job.srt_path or not await asyncio.to_thread(os.path.exists, job.srt_path):
             raise HTTPException(status_code=404, detail="字幕文件未生成")
         
         try:
@@ -206,7 +207,7 @@ def create_transcription_router(
             target_path = os.path.join(source_dir, srt_filename)
             
             # 复制文件
-            shutil.copy2(job.srt_path, target_path)
+            await asyncio.to_thread(shutil.copy2, job.srt_path, target_path)
             
             return {
                 "success": True,
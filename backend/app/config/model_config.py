@@ -3,57 +3,79 @@
 """
 
 import os
-from typing import List
+import functools
+from typing import Any, Dict, List
+
+
+def enable_fast_model_download():
+    """启用 hf_transfer（Rust 多线程下载器）加速模型下载
+
+    需在导入 whisperx / huggingface_hub 之前调用；未安装 hf_transfer 时静默跳过。
+    """
+    try:
+        import hf_transfer  # noqa: F401
+    except ImportError:
+        return
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 
 
 class ModelPreloadConfig:
-    """模型预加载配置"""
-    
-    # 基础配置
-    ENABLED = os.getenv("MODEL_PRELOAD_ENABLED", "true").lower() == "true"
-    
-    # 默认预加载的模型列表
-    DEFAULT_MODELS = os.getenv("MODEL_PRELOAD_MODELS", "medium").split(",")
-    
-    # 缓存配置
-    MAX_CACHE_SIZE = int(os.getenv("MODEL_CACHE_SIZE", "3"))
-    MEMORY_THRESHOLD = float(os.getenv("MODEL_MEMORY_THRESHOLD", "0.8"))
-    
-    # 预加载配置
-    PRELOAD_TIMEOUT = int(os.getenv("MODEL_PRELOAD_TIMEOUT", "300"))
-    WARMUP_ENABLED = os.getenv("MODEL_WARMUP_ENABLED", "true").lower() == "true"
-    
-    # 对齐模型配置
-    ALIGN_MODEL_CACHE_SIZE = int(os.getenv("ALIGN_MODEL_CACHE_SIZE", "5"))
+    """模型预加载配置
+
+    环境变量在首次访问时读取并缓存，导入本模块不再解析任何环境变量。
+    """
     
-    # 内存监控配置
-    MEMORY_CHECK_INTERVAL = int(os.getenv("MEMORY_CHECK_INTERVAL", "60"))  # 秒
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def env(cls) -> Dict[str, Any]:
+        """读取并缓存环境变量配置（进程启动后环境变量不会变化）"""
+        return {
+            # 基础配置
+            "ENABLED": os.getenv("MODEL_PRELOAD_ENABLED", "true").lower() == "true",
+            # 默认预加载的模型列表
+            "DEFAULT_MODELS": os.getenv("MODEL_PRELOAD_MODELS", "medium").split(","),
+            # 缓存配置
+            "MAX_CACHE_SIZE": int(os.getenv("MODEL_CACHE_SIZE", "3")),
+            "MEMORY_THRESHOLD": float(os.getenv("MODEL_MEMORY_THRESHOLD", "0.8")),
+            # 预加载配置
+            "PRELOAD_TIMEOUT": int(os.getenv("MODEL_PRELOAD_TIMEOUT", "300")),
+            # 服务启动后立即在后台预加载，而不是等待前端调用预加载接口
+            "PRELOAD_ON_STARTUP": os.getenv("MODEL_PRELOAD_ON_STARTUP", "true").lower() == "true",
+            "WARMUP_ENABLED": os.getenv("MODEL_WARMUP_ENABLED", "true").lower() == "true",
+            # 对齐模型配置
+            "ALIGN_MODEL_CACHE_SIZE": int(os.getenv("ALIGN_MODEL_CACHE_SIZE", "5")),
+            # 内存监控配置
+            "MEMORY_CHECK_INTERVAL": int(os.getenv("MEMORY_CHECK_INTERVAL", "60")),  # 秒
+        }
     
     @classmethod
     def get_preload_config(cls):
         """获取预加载配置对象"""
         from services.model_preload_manager import PreloadConfig
         
+        env = cls.env()
         return PreloadConfig(
-            enabled=cls.ENABLED,
-            default_models=cls.DEFAULT_MODELS,
-            max_cache_size=cls.MAX_CACHE_SIZE,
-            memory_threshold=cls.MEMORY_THRESHOLD,
-            preload_timeout=cls.PRELOAD_TIMEOUT,
-            warmup_enabled=cls.WARMUP_ENABLED
+            enabled=env["ENABLED"],
+            default_models=list(env["DEFAULT_MODELS"]),
+            max_cache_size=env["MAX_CACHE_SIZE"],
+            memory_threshold=env["MEMORY_THRESHOLD"],
+            preload_timeout=env["PRELOAD_TIMEOUT"],
+            warmup_enabled=env["WARMUP_ENABLED"]
         )
     
     @classmethod
     def print_config(cls):
         """打印当前配置"""
+        env = cls.env()
         print("模型预加载配置:")
-        print(f"  启用预加载: {cls.ENABLED}")
-        print(f"  默认模型: {cls.DEFAULT_MODELS}")
-        print(f"  最大缓存大小: {cls.MAX_CACHE_SIZE}")
-        print(f"  内存阈值: {cls.MEMORY_THRESHOLD}")
-        print(f"  预加载超时: {cls.PRELOAD_TIMEOUT}s")
-        print(f"  启用预热: {cls.WARMUP_ENABLED}")
-        print(f"  对齐模型缓存大小: {cls.ALIGN_MODEL_CACHE_SIZE}")
+        print(f"  启用预加载: {env['ENABLED']}")
+        print(f"  默认模型: {env['DEFAULT_MODELS']}")
+        print(f"  最大缓存大小: {env['MAX_CACHE_SIZE']}")
+        print(f"  内存阈值: {env['MEMORY_THRESHOLD']}")
+        print(f"  预加载超时: {env['PRELOAD_TIMEOUT']}s")
+        print(f"  启动时预加载: {env['PRELOAD_ON_STARTUP']}")
+        print(f"  启用预热: {env['WARMUP_ENABLED']}")
+        print(f"  对齐模型缓存大小: {env['ALIGN_MODEL_CACHE_SIZE']}")
 
 
 # 常用模型配置
@@ -0,0 +1,39 @@
+"""
+服务端通用配置
+"""
+import os
+import sys
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+
+# 允许跨域访问的前端地址（Vite 开发服务器默认 5174，端口被占用时顺延），可用 VTS_CORS_ORIGINS 覆盖（逗号分隔）
+CORS_ORIGINS = os.getenv("VTS_CORS_ORIGINS", ",".join(
+    f"http://{host}:{port}" for host in ("localhost", "127.0.0.1") for port in (5173, 5174, 5175)
+)).split(",")
+
+# 两个入口共用的 uvicorn 启动参数：
+# - 任务状态保存在进程内存中，只能单 worker；
+# - 不设 limit_max_requests：单进程下达到上限会直接退出，没有进程管理器负责重启；
+# - 非 Windows 平台使用 uvloop，HTTP 解析使用 httptools。
+UVICORN_OPTIONS = {
+    "host": "127.0.0.1",
+    "port": 8000,
+    "reload": False,
+    "loop": "asyncio" if sys.platform == "win32" else "uvloop",
+    "http": "httptools",
+    "limit_concurrency": 50,
+}
+
+
+def add_cors_middleware(app: FastAPI) -> None:
+    """为应用添加 CORS 中间件"""
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        max_age=86400,  # 浏览器缓存预检结果一天
+    )
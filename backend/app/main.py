@@ -1,62 +1,114 @@
 import os
 import sys
 import uuid
-import shutil
 import logging
 import asyncio
+import functools
+import signal
 import time
-from fastapi import FastAPI, Form, HTTPException, UploadFile, File
-from fastapi.responses import FileResponse
-from fastapi.middleware.cors import CORSMiddleware
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from fastapi import FastAPI, BackgroundTasks, Form, HTTPException, Query, Request, Response, UploadFile, File
+from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
-import json
+import orjson
 from typing import Optional, List
 from datetime import datetime
 
 # 添加当前目录到Python路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from processor import JobSettings, CPUAffinityConfig, get_processor, initialize_model_manager, preload_default_models, get_preload_status, get_cache_status
-from services.model_preload_manager import PreloadConfig
+from config.model_config import enable_fast_model_download
+from config.server_config import UVICORN_OPTIONS, add_cors_middleware
+enable_fast_model_download()  # 须在导入 whisperx 相关模块之前
+
+# processor 会导入 torch / whisperx，改为首次使用时再加载（见 get_processor_module）
+from services.file_service import (
+    copy_if_changed, ensure_dirs, is_media_file, mirror_to_output, save_upload_file, stat_or_none
+)
 from config.model_config import ModelPreloadConfig
 
+# 配置日志（须在模块内任何日志输出之前）
+logging.basicConfig(level=logging.INFO, 
+                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
 app = FastAPI(title="Video To SRT API", version="0.3.0")
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+add_cors_middleware(app)
 
 @app.on_event("startup")
 async def startup_event():
-    """应用启动事件 - 初始化模型管理器"""
+    """应用启动事件 - 在后台线程初始化模型管理器，不阻塞端口监听"""
+    # 显式限定默认线程池大小（仅约束 asyncio.to_thread；同步路由由 anyio 线程池执行，不受此限制）
+    app.state.io_executor = ThreadPoolExecutor(max_workers=IO_THREADS, thread_name_prefix="fastapi-io")
+    asyncio.get_running_loop().set_default_executor(app.state.io_executor)
+    app.state.init_task = asyncio.create_task(asyncio.to_thread(initialize_backend))
+    # 硬件检测在初始化完成后进行（两者都会首次导入 torch，不能在两个线程中并发导入），前端首次查询时直接命中缓存
+    app.state.hardware_task = asyncio.create_task(warm_hardware_snapshot())
+    env = ModelPreloadConfig.env()
+    if env["ENABLED"] and env["PRELOAD_ON_STARTUP"]:
+        app.state.preload_task = asyncio.create_task(preload_on_startup())
+
+async def warm_hardware_snapshot():
+    """启动时在后台完成硬件检测，失败时留待首次请求重试"""
+    try:
+        await get_hardware_snapshot()
+    except Exception as e:
+        logger.warning(f"启动硬件检测失败: {str(e)}")
+
+async def preload_on_startup():
+    """初始化完成后立即预加载默认模型，使首个转录任务直接命中缓存
+
+    前端稍后调用 /api/models/preload/start 时，模型管理器会返回“进行中”或直接命中缓存。
+    """
+    try:
+        processor = await get_backend()
+        result = await processor.preload_default_models()
+        if result.get("success"):
+            logger.info(f"启动预加载完成: {result.get('loaded_models', 0)}/{result.get('total_models', 0)} 个模型")
+        else:
+            logger.warning(f"启动预加载未成功: {result.get('message', result.get('errors'))}")
+    except Exception as e:
+        logger.error(f"启动预加载失败: {str(e)}", exc_info=True)
+
+def initialize_backend():
+    """导入模型相关依赖，创建处理器并初始化模型管理器，返回是否成功"""
     try:
         logger.info("服务启动中，初始化模型管理器...")
         
         # 初始化模型管理器
-        model_manager = initialize_model_manager(preload_config)
+        processor = get_processor_module()
+        processor.initialize_model_manager(ModelPreloadConfig.get_preload_config())
         logger.info("模型管理器初始化成功")
         
-        # 不在启动时预加载模型，等待前端就绪后通过API调用
-        logger.info("后端服务已就绪，等待前端启动后进行模型预加载")
+        logger.info("后端服务已就绪")
+        return True
         
     except Exception as e:
         logger.error(f"启动初始化失败: {str(e)}", exc_info=True)
+        return False
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """应用关闭事件 - 清理资源"""
     try:
-        from processor import get_model_manager
-        model_manager = get_model_manager()
+        # 处理器从未加载时无需清理，也不必为此导入模型依赖
+        if _processor_module is None:
+            return
+        model_manager = _processor_module.get_model_manager()
         if model_manager:
-            model_manager.clear_cache()
+            model_manager.clear_cache(force=True)
+            model_manager.shutdown()
             logger.info("已清理模型缓存")
     except Exception as e:
         logger.error(f"清理资源失败: {str(e)}")
+    finally:
+        io_executor = getattr(app.state, "io_executor", None)
+        if io_executor is not None:
+            io_executor.shutdown(wait=False)
 
 # 目录配置
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -65,23 +117,60 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "output")
 JOBS_DIR = os.path.join(BASE_DIR, "jobs")
 TEMP_DIR = os.path.join(BASE_DIR, "temp")
 
-print(f"DEBUG: BASE_DIR = {BASE_DIR}")
-print(f"DEBUG: INPUT_DIR = {INPUT_DIR}")
-print(f"DEBUG: INPUT_DIR exists = {os.path.exists(INPUT_DIR)}")
+logger.debug("BASE_DIR = %s", BASE_DIR)
+logger.debug("INPUT_DIR = %s", INPUT_DIR)
 
-# 确保目录存在
-for dir_path in [INPUT_DIR, OUTPUT_DIR, JOBS_DIR, TEMP_DIR]:
-    os.makedirs(dir_path, exist_ok=True)
+# 任务ID随机字节池
+JOB_ID_POOL_SIZE = 256
+_job_id_pool = deque()
+_job_id_lock = threading.Lock()
 
-proc = get_processor(JOBS_DIR)
+# 默认线程池（文件读写、目录扫描等阻塞操作）的线程数
+IO_THREADS = max(1, int(os.getenv("VTS_IO_THREADS", "8")))
 
-# 配置日志
-logging.basicConfig(level=logging.INFO, 
-                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
+# 服务未就绪时建议客户端重试的间隔（秒）
+READINESS_RETRY_AFTER = 5
+
+# /api/files 结果缓存，以 (INPUT_DIR 的 mtime, 代数) 作为失效依据，上传完成时递增代数；
+# 已列出文件的内容变化（外部写入、覆盖）不改变目录 mtime，缓存最多保留 FILES_CACHE_TTL 秒
+FILES_CACHE_TTL = 2.0
+_files_cache = {'key': None, 'payload': None, 'etag': None, 'generation': 0, 'ts': 0.0}
 
-# 初始化模型预加载管理器
-preload_config = ModelPreloadConfig.get_preload_config()
+# 确保目录存在
+ensure_dirs(BASE_DIR, ("input", "output", "jobs", "temp"))
+
+# input 目录的规范路径，用于校验删除请求不会越出该目录
+INPUT_DIR_REAL = os.path.realpath(INPUT_DIR)
+
+# 延迟加载的 processor 模块
+_processor_module = None
+_processor_lock = threading.Lock()
+
+def get_processor_module():
+    """首次调用时导入 processor 模块并创建处理器单例"""
+    global _processor_module
+    if _processor_module is None:
+        with _processor_lock:
+            if _processor_module is None:
+                import processor
+                processor.get_processor(JOBS_DIR)
+                _processor_module = processor
+    return _processor_module
+
+async def wait_backend_init():
+    """等待后台初始化结束（无论成功与否），等待期间不阻塞事件循环"""
+    init_task = getattr(app.state, "init_task", None)
+    if init_task is not None and not init_task.done():
+        await asyncio.shield(init_task)
+
+async def get_backend():
+    """等待后台初始化完成后返回 processor 模块"""
+    await wait_backend_init()
+    return get_processor_module()
+
+async def get_proc():
+    """获取转录处理器"""
+    return (await get_backend()).get_processor(JOBS_DIR)
 
 # 打印配置信息
 ModelPreloadConfig.print_config()
@@ -104,50 +193,80 @@ class UploadResponse(BaseModel):
     original_name: str
     message: str
 
-class FileInfo(BaseModel):
-    name: str
-    size: int
-    modified: str
-    path: str
-
-def get_file_size_str(size_bytes):
-    """格式化文件大小"""
-    if size_bytes == 0:
-        return "0 B"
-    size_names = ["B", "KB", "MB", "GB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    return f"{size_bytes:.1f} {size_names[i]}"
-
-def is_video_or_audio_file(filename):
-    """检查是否为支持的视频或音频文件"""
-    video_extensions = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
-    audio_extensions = {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma'}
-    ext = os.path.splitext(filename.lower())[1]
-    return ext in video_extensions or ext in audio_extensions
+def new_job_id():
+    """生成任务ID，格式与 uuid.uuid4().hex 一致
+
+    随机字节按批次从 os.urandom 预取，避免每个任务都触发一次系统调用。
+    """
+    with _job_id_lock:
+        if not _job_id_pool:
+            raw = os.urandom(16 * JOB_ID_POOL_SIZE)
+            _job_id_pool.extend(raw[i:i + 16] for i in range(0, len(raw), 16))
+        return uuid.UUID(bytes=_job_id_pool.popleft(), version=4).hex
+
+def scan_input_dir():
+    """扫描 input 目录中的媒体文件，返回按修改时间倒序的 (mtime, 文件名, 大小, 路径) 列表"""
+    entries = []
+    # scandir 在目录枚举时即带回文件类型信息，避免逐个 isfile/stat
+    with os.scandir(INPUT_DIR) as it:
+        for entry in it:
+            if entry.is_file() and is_media_file(entry.name):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name, stat.st_size, entry.path))
+    
+    # 按修改时间倒序排列：直接比较浮点时间戳，排序后再格式化日期
+    entries.sort(key=itemgetter(0), reverse=True)
+    return entries
 
 @app.get("/api/files")
-async def list_files():
-    """获取输入目录中的所有媒体文件"""
+async def list_files(request: Request, limit: Optional[int] = Query(None, ge=1), offset: int = Query(0, ge=0)):
+    """获取输入目录中的媒体文件，可用 limit/offset 分页"""
     try:
-        files = []
-        if os.path.exists(INPUT_DIR):
-            for filename in os.listdir(INPUT_DIR):
-                file_path = os.path.join(INPUT_DIR, filename)
-                if os.path.isfile(file_path) and is_video_or_audio_file(filename):
-                    stat = os.stat(file_path)
-                    files.append(FileInfo(
-                        name=filename,
-                        size=stat.st_size,
-                        modified=datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                        path=file_path
-                    ))
+        # 目录 mtime 与代数均未变化（无增删改名、无上传完成）且缓存未过期时直接返回上次的结果，一次 stat 代替整个目录扫描
+        try:
+            dir_mtime = os.stat(INPUT_DIR).st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime = None
+        
+        # 在扫描前读取代数：扫描期间若有上传完成，本次结果不写回缓存
+        generation = _files_cache['generation']
+        cache_key = (dir_mtime, generation)
         
-        # 按修改时间倒序排列
-        files.sort(key=lambda x: x.modified, reverse=True)
-        return {"files": files, "input_dir": INPUT_DIR}
+        if (dir_mtime is not None and cache_key == _files_cache['key']
+                and time.monotonic() - _files_cache['ts'] < FILES_CACHE_TTL):
+            payload, etag = _files_cache['payload'], _files_cache['etag']
+        else:
+            # 目录扫描在线程中执行，大目录或慢速存储不会阻塞事件循环
+            scanned_at = time.monotonic()
+            entries = await asyncio.to_thread(scan_input_dir) if dir_mtime is not None else []
+            files = [
+                # 直接构造字典，省去 pydantic 模型的构造与序列化前的转换
+                {
+                    "name": name,
+                    "size": size,
+                    "modified": datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                    "path": path
+                }
+                for mtime, name, size, path in entries
+            ]
+            payload = {"files": files, "input_dir": INPUT_DIR, "total": len(files)}
+            # 弱 ETag 由扫描结果（文件名、大小、修改时间）计算，内容变化必然改变 ETag
+            etag = f'W/"{hash(tuple(entries)) & 0xffffffffffffffff:x}"'
+            if dir_mtime is not None and _files_cache['generation'] == generation:
+                _files_cache['key'] = cache_key
+                _files_cache['payload'] = payload
+                _files_cache['etag'] = etag
+                _files_cache['ts'] = scanned_at
+        
+        # 轮询时内容未变化直接返回 304，省去序列化与传输
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        # 列表已按修改时间倒序排好，分页只需切片
+        if offset or limit is not None:
+            end = offset + limit if limit is not None else None
+            payload = {**payload, "files": payload["files"][offset:end]}
+        return JSONResponse(payload, headers={"ETag": etag})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"获取文件列表失败: {str(e)}")
 
@@ -155,11 +274,16 @@ async def list_files():
 async def delete_file(filename: str):
     """删除input目录中的文件"""
     try:
-        file_path = os.path.join(INPUT_DIR, filename)
-        if not os.path.exists(file_path):
-            raise HTTPException(status_code=404, detail="文件不存在")
+        # 拒绝 ".." 等路径穿越
+        file_path = os.path.normpath(os.path.join(INPUT_DIR_REAL, filename))
+        if os.path.dirname(file_path) != INPUT_DIR_REAL:
+            raise HTTPException(status_code=400, detail="非法文件名")
         
-        os.remove(file_path)
+        # 直接 unlink，以 FileNotFoundError 判断文件不存在，省去事先的 exists 检查
+        try:
+            await asyncio.to_thread(os.unlink, file_path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="文件不存在")
         return {"success": True, "message": f"文件 {filename} 已删除"}
     except HTTPException:
         raise
@@ -171,33 +295,22 @@ async def upload_file(file: UploadFile = File(...)):
     """上传文件并自动创建转录任务"""
     try:
         # 验证文件类型
-        if not is_video_or_audio_file(file.filename):
+        if not is_media_file(file.filename):
             raise HTTPException(status_code=400, detail="不支持的文件格式")
         
-        # 保存用户原始文件路径信息
-        original_filename = file.filename
-        
-        # 将文件保存到input目录
-        input_path = os.path.join(INPUT_DIR, original_filename)
-        
-        # 如果同名文件已存在，添加时间戳
-        counter = 1
-        base_name, ext = os.path.splitext(original_filename)
-        while os.path.exists(input_path):
-            new_filename = f"{base_name}_{counter}{ext}"
-            input_path = os.path.join(INPUT_DIR, new_filename)
-            original_filename = new_filename
-            counter += 1
-        
-        # 保存文件
-        with open(input_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        # 保存文件到input目录：同名文件自动加序号，分块流式写入，在线程中执行避免阻塞事件循环
+        original_filename, input_path = await asyncio.to_thread(save_upload_file, file.file, INPUT_DIR, file.filename)
+        # 写入过程中目录 mtime 不再变化，写完后递增代数作废列表缓存，避免缓存中文件大小停留在写入中途
+        _files_cache['generation'] += 1
         
         # 创建转录任务
-        job_id = uuid.uuid4().hex
-        settings = JobSettings()
-        proc.create_job(original_filename, input_path, settings, job_id=job_id)
+        processor = await get_backend()
+        job_id = new_job_id()
+        settings = processor.JobSettings()
+        # create_job 会把整个媒体文件复制到任务目录，在线程中执行避免阻塞事件循环
+        await asyncio.to_thread(
+            processor.get_processor(JOBS_DIR).create_job, original_filename, input_path, settings, job_id=job_id
+        )
         
         return {
             "job_id": job_id, 
@@ -215,15 +328,16 @@ async def create_job(filename: str = Form(...)):
     """为指定文件创建转录任务（保留兼容性）"""
     try:
         input_path = os.path.join(INPUT_DIR, filename)
-        if not os.path.exists(input_path):
+        if not await asyncio.to_thread(os.path.exists, input_path):
             raise HTTPException(status_code=404, detail="文件不存在")
         
-        if not is_video_or_audio_file(filename):
+        if not is_media_file(filename):
             raise HTTPException(status_code=400, detail="不支持的文件格式")
         
-        job_id = uuid.uuid4().hex
-        settings = JobSettings()
-        proc.create_job(filename, input_path, settings, job_id=job_id)
+        processor = await get_backend()
+        job_id = new_job_id()
+        settings = processor.JobSettings()
+        await asyncio.to_thread(processor.get_processor(JOBS_DIR).create_job, filename, input_path, settings, job_id=job_id)
         
         return {"job_id": job_id, "filename": filename}
     except HTTPException:
@@ -233,13 +347,16 @@ async def create_job(filename: str = Form(...)):
 
 @app.post("/api/start")
 async def start(job_id: str = Form(...), settings: str = Form(...)):
-    settings_obj = TranscribeSettings(**json.loads(settings))
+    # 由 pydantic-core 一次完成 JSON 解析与校验，省去中间 dict 与 **kwargs 展开
+    settings_obj = TranscribeSettings.model_validate_json(settings)
+    processor = await get_backend()
+    proc = processor.get_processor(JOBS_DIR)
     job = proc.get_job(job_id)
     if not job:
         return {"error": "无效 job_id"}
     
     # 创建CPU亲和性配置
-    cpu_config = CPUAffinityConfig(
+    cpu_config = processor.CPUAffinityConfig(
         enabled=settings_obj.cpu_affinity_enabled,
         strategy=settings_obj.cpu_affinity_strategy,
         custom_cores=settings_obj.cpu_affinity_custom_cores,
@@ -247,7 +364,7 @@ async def start(job_id: str = Form(...), settings: str = Form(...)):
     )
     
     # 覆盖设置
-    job.settings = JobSettings(
+    job.settings = processor.JobSettings(
         model=settings_obj.model,
         compute_type=settings_obj.compute_type,
         device=settings_obj.device,
@@ -261,6 +378,7 @@ async def start(job_id: str = Form(...), settings: str = Form(...)):
 
 @app.post("/api/cancel/{job_id}")
 async def cancel(job_id: str):
+    proc = await get_proc()
     job = proc.get_job(job_id)
     if not job:
         return {"error": "未找到"}
@@ -269,18 +387,22 @@ async def cancel(job_id: str):
 
 @app.get("/api/status/{job_id}")
 async def status(job_id: str):
+    proc = await get_proc()
     job = proc.get_job(job_id)
     if not job:
         return {"error": "未找到"}
     return job.to_dict()
 
 @app.get("/api/download/{job_id}")
-async def download(job_id: str, copy_to_source: bool = False):
+async def download(job_id: str, background_tasks: BackgroundTasks, copy_to_source: bool = False):
+    proc = await get_proc()
     job = proc.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="任务未找到")
     
-    if job.srt_path and os.path.exists(job.srt_path):
+    # 一次 stat 同时完成存在性检查，并交给 FileResponse 复用，省去其内部的再次 stat
+    srt_stat = await asyncio.to_thread(stat_or_none, job.srt_path) if job.srt_path else None
+    if srt_stat is not None:
         filename = os.path.basename(job.srt_path)
         
         # 如果需要复制到源文件目录
@@ -290,41 +412,34 @@ async def download(job_id: str, copy_to_source: bool = False):
             source_srt_path = os.path.join(source_dir, filename)
             
             try:
-                # 复制SRT文件到源文件目录
-                shutil.copy2(job.srt_path, source_srt_path)
-                print(f"SRT文件已复制到源目录: {source_srt_path}")
+                # 复制SRT文件到源文件目录（在线程中执行，已是最新副本时跳过）
+                await asyncio.to_thread(copy_if_changed, job.srt_path, source_srt_path)
+                logger.info("SRT文件已复制到源目录: %s", source_srt_path)
             except Exception as e:
-                print(f"复制到源目录失败: {e}")
+                logger.warning("复制到源目录失败: %s", e)
         
-        # 同时复制到输出目录
+        # 输出目录的副本改为响应发出后在后台同步，直接返回任务目录中的原文件，下载不再等待复制
         output_path = os.path.join(OUTPUT_DIR, filename)
-        try:
-            if not os.path.exists(output_path):
-                shutil.copy2(job.srt_path, output_path)
-            
-            return FileResponse(
-                path=output_path, 
-                filename=filename, 
-                media_type='text/plain; charset=utf-8'
-            )
-        except Exception as e:
-            # 如果复制失败，直接返回原文件
-            return FileResponse(
-                path=job.srt_path, 
-                filename=filename, 
-                media_type='text/plain; charset=utf-8'
-            )
+        background_tasks.add_task(mirror_to_output, job.srt_path, output_path)
+        
+        return FileResponse(
+            path=job.srt_path, 
+            filename=filename, 
+            media_type='text/plain; charset=utf-8',
+            stat_result=srt_stat
+        )
     
     raise HTTPException(status_code=404, detail="字幕文件未生成")
 
 @app.post("/api/copy-result/{job_id}")
 async def copy_result_to_source(job_id: str):
     """将转录结果复制到源文件目录"""
+    proc = await get_proc()
     job = proc.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="任务未找到")
     
-    if not job.srt_path or not os.path.exists(job.srt_path):
+    if not job.srt_path:
         raise HTTPException(status_code=404, detail="字幕文件未生成")
     
     try:
@@ -339,25 +454,52 @@ async def copy_result_to_source(job_id: str):
         srt_filename = os.path.basename(job.srt_path)
         target_path = os.path.join(source_dir, srt_filename)
         
-        # 复制文件
-        shutil.copy2(job.srt_path, target_path)
+        # 复制文件（在线程中执行，已是最新副本时跳过）
+        # 不再单独检查字幕是否存在，源文件缺失由同一次线程调用中的 FileNotFoundError 反映
+        try:
+            await asyncio.to_thread(copy_if_changed, job.srt_path, target_path)
+        except FileNotFoundError as e:
+            if e.filename != job.srt_path:
+                raise
+            raise HTTPException(status_code=404, detail="字幕文件未生成")
         
         return {
             "success": True,
             "message": f"字幕文件已复制到: {target_path}",
             "target_path": target_path
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"复制文件失败: {str(e)}")
 
+# /api/ping 的固定响应体
+PING_BODY = b'{"pong":true}'
+
 @app.get("/api/ping")
 async def ping():
-    return {"pong": True}
+    return Response(content=PING_BODY, media_type="application/json")
+
+@app.get("/api/readiness")
+async def readiness():
+    """就绪检查：后台初始化成功且没有正在进行的模型预加载时返回 200，否则返回 503"""
+    init_task = getattr(app.state, "init_task", None)
+    if _processor_module is None or (init_task is not None and not init_task.done()):
+        return Response(status_code=503, headers={"Retry-After": str(READINESS_RETRY_AFTER)})
+    if init_task is not None and not init_task.result():
+        # 初始化失败（日志中有“启动初始化失败”），重试不会恢复，不带 Retry-After
+        return JSONResponse({"ready": False, "message": "后端初始化失败"}, status_code=503)
+    
+    status = _processor_module.get_preload_status()
+    if status.get("is_preloading"):
+        return Response(status_code=503, headers={"Retry-After": str(READINESS_RETRY_AFTER)})
+    return {"ready": True, "loaded_models": status.get("loaded_models", 0)}
 
 @app.get("/api/cpu-info")
 async def get_cpu_info():
     """获取系统CPU信息和亲和性支持状态"""
     try:
+        proc = await get_proc()
         cpu_info = proc.cpu_manager.get_system_info()
         return {
             "success": True,
@@ -371,20 +513,81 @@ async def get_cpu_info():
             "cpu_info": {"supported": False}
         }
 
+@functools.lru_cache(maxsize=None)
+def get_hardware_services():
+    """返回 (硬件检测器, 优化器) 单例
+
+    hardware_service 会导入 torch，因此不放在模块顶部导入；首次调用后缓存引用，
+    后续请求不再执行 import 语句。
+    """
+    from services.hardware_service import get_hardware_detector, get_hardware_optimizer
+    return get_hardware_detector(), get_hardware_optimizer()
+
+# 硬件检测结果缓存：(硬件信息, 优化配置, 各硬件接口预先序列化的响应体)
+# 可用内存、临时目录空间等会变化，缓存超过 HARDWARE_CACHE_TTL 秒后重新检测
+HARDWARE_CACHE_TTL = float(os.environ.get("VTS_HARDWARE_CACHE_TTL", "30"))
+_hardware_snapshot = None
+_hardware_snapshot_ts = 0.0
+_hardware_lock = None
+
+def detect_hardware_snapshot():
+    """执行硬件检测并生成优化配置，返回 (硬件信息, 优化配置, 预序列化响应体)"""
+    detector, optimizer = get_hardware_services()
+    hardware_info = detector.detect()
+    optimization_config = optimizer.get_optimization_config(hardware_info)
+    hardware = hardware_info.to_dict()
+    optimization = optimization_config.to_dict()
+    # 缓存有效期内结果不变，响应体只序列化一次
+    payloads = {
+        "basic": orjson.dumps({
+            "success": True,
+            "hardware": hardware,
+            "message": "硬件信息获取成功"
+        }),
+        "optimize": orjson.dumps({
+            "success": True,
+            "optimization": optimization,
+            "message": "优化配置获取成功"
+        }),
+        "status": orjson.dumps({
+            "success": True,
+            "hardware": hardware,
+            "optimization": optimization,
+            "message": "硬件状态获取成功"
+        }),
+    }
+    return hardware_info, optimization_config, payloads
+
+def hardware_snapshot_fresh():
+    return (_hardware_snapshot is not None
+            and time.monotonic() - _hardware_snapshot_ts < HARDWARE_CACHE_TTL)
+
+async def get_hardware_snapshot():
+    """返回 (硬件信息, 优化配置, 预序列化响应体)
+
+    检测会探测 CUDA、CPU 与磁盘，放在线程中执行；有效期内的请求直接返回缓存，不再切换线程。
+    过期后由第一个请求重新检测，并发请求在锁上等待同一次检测结果。
+    """
+    global _hardware_snapshot, _hardware_snapshot_ts, _hardware_lock
+    if hardware_snapshot_fresh():
+        return _hardware_snapshot
+    if _hardware_lock is None:
+        # 在事件循环内创建，避免绑定到导入时的循环
+        _hardware_lock = asyncio.Lock()
+    async with _hardware_lock:
+        if not hardware_snapshot_fresh():
+            # hardware_service 会导入 torch，须等初始化线程完成 torch 的首次导入，避免两个线程并发导入
+            await wait_backend_init()
+            _hardware_snapshot = await asyncio.to_thread(detect_hardware_snapshot)
+            _hardware_snapshot_ts = time.monotonic()
+    return _hardware_snapshot
+
 @app.get("/api/hardware/basic")
 async def get_hardware_basic():
     """获取核心硬件信息"""
     try:
-        # 创建临时的硬件检测服务以获取信息
-        from services.hardware_service import get_hardware_detector
-        detector = get_hardware_detector()
-        hardware_info = detector.detect()
-        
-        return {
-            "success": True,
-            "hardware": hardware_info.to_dict(),
-            "message": "硬件信息获取成功"
-        }
+        _, _, payloads = await get_hardware_snapshot()
+        return Response(content=payloads["basic"], media_type="application/json")
     except Exception as e:
         return {
             "success": False,
@@ -395,18 +598,8 @@ async def get_hardware_basic():
 async def get_hardware_optimization():
     """获取基于硬件的优化配置"""
     try:
-        from services.hardware_service import get_hardware_detector, get_hardware_optimizer
-        detector = get_hardware_detector()
-        optimizer = get_hardware_optimizer()
-        
-        hardware_info = detector.detect()
-        optimization_config = optimizer.get_optimization_config(hardware_info)
-        
-        return {
-            "success": True,
-            "optimization": optimization_config.to_dict(),
-            "message": "优化配置获取成功"
-        }
+        _, _, payloads = await get_hardware_snapshot()
+        return Response(content=payloads["optimize"], media_type="application/json")
     except Exception as e:
         return {
             "success": False,
@@ -417,19 +610,8 @@ async def get_hardware_optimization():
 async def get_hardware_status():
     """获取完整的硬件状态和优化信息"""
     try:
-        from services.hardware_service import get_hardware_detector, get_hardware_optimizer
-        detector = get_hardware_detector()
-        optimizer = get_hardware_optimizer()
-        
-        hardware_info = detector.detect()
-        optimization_config = optimizer.get_optimization_config(hardware_info)
-        
-        return {
-            "success": True,
-            "hardware": hardware_info.to_dict(),
-            "optimization": optimization_config.to_dict(),
-            "message": "硬件状态获取成功"
-        }
+        _, _, payloads = await get_hardware_snapshot()
+        return Response(content=payloads["status"], media_type="application/json")
     except Exception as e:
         return {
             "success": False,
@@ -441,7 +623,7 @@ async def get_hardware_status():
 async def get_models_preload_status():
     """获取模型预加载状态"""
     try:
-        status = get_preload_status()
+        status = (await get_backend()).get_preload_status()
         return {
             "success": True,
             "data": status,
@@ -458,7 +640,7 @@ async def get_models_preload_status():
 async def get_models_cache_status():
     """获取模型缓存状态"""
     try:
-        status = get_cache_status()
+        status = (await get_backend()).get_cache_status()
         return {
             "success": True,
             "data": status,
@@ -478,8 +660,7 @@ async def start_models_preload():
         logger.info("🚀 收到模型预加载请求")
 
         # 检查模型管理器
-        from processor import get_model_manager
-        model_manager = get_model_manager()
+        model_manager = (await get_backend()).get_model_manager()
         if not model_manager:
             logger.error("❌ 模型管理器未初始化")
             return {"success": False, "message": "模型管理器未初始化"}
@@ -508,14 +689,16 @@ async def start_models_preload():
         return {"success": False, "message": f"启动预加载失败: {str(e)}"}
 
 @app.post("/api/models/cache/clear")
-async def clear_models_cache():
-    """清空模型缓存 - 简化版本，立即同步状态"""
+async def clear_models_cache(force: bool = False):
+    """清空模型缓存 - 简化版本，立即同步状态
+    
+    预加载的模型默认保留，force=true 时一并清除。
+    """
     try:
-        from processor import get_model_manager
-        model_manager = get_model_manager()
+        model_manager = (await get_backend()).get_model_manager()
         
         if model_manager:
-            model_manager.clear_cache()
+            await model_manager.clear_cache_serialized(force=force)
             logger.info("✅ 手动清空模型缓存成功")
             return {
                 "success": True,
@@ -539,8 +722,7 @@ async def clear_models_cache():
 async def reset_preload_attempts():
     """重置预加载失败计数"""
     try:
-        from processor import get_model_manager
-        model_manager = get_model_manager()
+        model_manager = (await get_backend()).get_model_manager()
         
         if model_manager:
             model_manager.reset_preload_attempts()
@@ -568,11 +750,10 @@ async def shutdown_server():
     try:
         logger.info("收到关闭服务器请求")
         
-        # 清理资源
-        from processor import get_model_manager
-        model_manager = get_model_manager()
+        # 清理资源：直接清空，不排在进行中的模型加载（可能是首次下载）之后，避免关闭请求长时间无响应
+        model_manager = (await get_backend()).get_model_manager()
         if model_manager:
-            model_manager.clear_cache()
+            model_manager.clear_cache(force=True)
             logger.info("已清理模型缓存")
         
         # 返回成功响应
@@ -582,8 +763,6 @@ async def shutdown_server():
         }
         
         # 异步关闭服务器
-        import asyncio
-        import os
         asyncio.create_task(delayed_shutdown())
         
         return response
@@ -595,15 +774,32 @@ async def shutdown_server():
             "message": f"关闭服务器失败: {str(e)}"
         }
 
+# 优雅关闭的最长等待时间（秒），超时后强制结束进程
+SHUTDOWN_FORCE_EXIT_TIMEOUT = 10
+
 async def delayed_shutdown():
     """延迟关闭服务器，给响应时间返回"""
     await asyncio.sleep(1)  # 等待1秒让响应返回
     logger.info("服务器即将关闭...")
-    import os
-    os._exit(0)
+    # 兜底：超时仍未退出则强制结束进程。事件循环结束后解释器退出会等待模型加载等线程池中的任务，
+    # 因此使用守护线程计时，而不是事件循环中的任务
+    force_exit = threading.Timer(SHUTDOWN_FORCE_EXIT_TIMEOUT, os._exit, (0,))
+    force_exit.daemon = True
+    force_exit.start()
+    server = getattr(app.state, "server", None)
+    if server is not None:
+        # 通知 uvicorn 正常退出：处理完进行中的请求并执行 shutdown 事件，释放模型与线程池
+        server.should_exit = True
+    else:
+        # 由外部 uvicorn 命令启动时拿不到 Server 实例：向自身发送 SIGINT，
+        # 由 uvicorn 的信号处理走同样的正常退出流程，而不是直接 os._exit 跳过清理
+        signal.raise_signal(signal.SIGINT)
 
 if __name__ == "__main__":
     import uvicorn
     # 直接传入 app，关闭 reload，确保使用当前文件内定义的应用实例
-    uvicorn.run(app, host="127.0.0.1", port=8000, reload=False,
-                limit_max_requests=1000, limit_concurrency=50)
+    config = uvicorn.Config(app, **UVICORN_OPTIONS)
+    server = uvicorn.Server(config)
+    # 保存 Server 实例，/api/shutdown 通过 should_exit 优雅退出
+    app.state.server = server
+    server.run()
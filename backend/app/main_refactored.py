@@ -4,27 +4,28 @@ Video To SRT - 主应用程序
 """
 import os
 import sys
+import logging
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
 # 添加当前目录到Python路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from config.model_config import enable_fast_model_download
+from config.server_config import UVICORN_OPTIONS, add_cors_middleware
+enable_fast_model_download()
+
 from services import get_transcription_service, FileManagementService
+from services.file_service import ensure_dirs
 from api.routes import create_file_router, create_transcription_router
 from api.routes.hardware_routes import create_hardware_router
 
+logger = logging.getLogger(__name__)
+
 # FastAPI应用实例
 app = FastAPI(title="Video To SRT API", version="0.4.0")
 
 # CORS中间件
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+add_cors_middleware(app)
 
 # 目录配置
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -33,13 +34,11 @@ OUTPUT_DIR = os.path.join(BASE_DIR, "output")
 JOBS_DIR = os.path.join(BASE_DIR, "jobs")
 TEMP_DIR = os.path.join(BASE_DIR, "temp")
 
-print(f"DEBUG: BASE_DIR = {BASE_DIR}")
-print(f"DEBUG: INPUT_DIR = {INPUT_DIR}")
-print(f"DEBUG: INPUT_DIR exists = {os.path.exists(INPUT_DIR)}")
+logger.debug("BASE_DIR = %s", BASE_DIR)
+logger.debug("INPUT_DIR = %s", INPUT_DIR)
 
 # 确保目录存在
-for dir_path in [INPUT_DIR, OUTPUT_DIR, JOBS_DIR, TEMP_DIR]:
-    os.makedirs(dir_path, exist_ok=True)
+ensure_dirs(BASE_DIR, ("input", "output", "jobs", "temp"))
 
 # 初始化服务
 transcription_service = get_transcription_service(JOBS_DIR)
@@ -65,5 +64,4 @@ async def ping():
 if __name__ == "__main__":
     import uvicorn
     # 直接传入 app，关闭 reload，确保使用当前文件内定义的应用实例
-    uvicorn.run(app, host="127.0.0.1", port=8000, reload=False,
-                limit_max_requests=1000, limit_concurrency=50)
\ No newline at end of file
+    uvicorn.run(app, **UVICORN_OPTIONS)
\ No newline at end of file
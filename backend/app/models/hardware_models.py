@@ -4,9 +4,13 @@
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 import logging
+import sys
 
+# Python 3.10+ 使用 slots 数据类：实例不带 __dict__，属性访问更快；更低版本保持普通数据类
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class HardwareInfo:
     """核心硬件信息结构"""
     # GPU关键信息
@@ -30,13 +34,17 @@ class HardwareInfo:
     
     def to_dict(self) -> Dict:
         """转换为字典格式"""
+        gpu_memory_mb = self.gpu_memory_mb
+        gpu_total_mb = sum(gpu_memory_mb) if gpu_memory_mb else 0
+        memory_total_mb = self.memory_total_mb
+        memory_available_mb = self.memory_available_mb
         return {
             "gpu": {
                 "count": self.gpu_count,
-                "memory_mb": self.gpu_memory_mb,
+                "memory_mb": gpu_memory_mb,
                 "cuda_available": self.cuda_available,
-                "total_memory_mb": sum(self.gpu_memory_mb) if self.gpu_memory_mb else 0,
-                "available_memory_mb": sum(self.gpu_memory_mb) if self.gpu_memory_mb else 0,  # 简化处理
+                "total_memory_mb": gpu_total_mb,
+                "available_memory_mb": gpu_total_mb,  # 简化处理
                 "memory_usage_percent": 0,  # 简化处理
                 "name": self.gpu_name,
                 "device_name": self.gpu_name  # 兼容前端的多种字段名
@@ -49,10 +57,10 @@ class HardwareInfo:
                 "usage_percent": 0  # 简化处理，前端可以不显示或者默认为0
             },
             "memory": {
-                "total_mb": self.memory_total_mb,
-                "available_mb": self.memory_available_mb,
-                "used_mb": self.memory_total_mb - self.memory_available_mb,
-                "usage_percent": round((1 - self.memory_available_mb / max(1, self.memory_total_mb)) * 100, 1)
+                "total_mb": memory_total_mb,
+                "available_mb": memory_available_mb,
+                "used_mb": memory_total_mb - memory_available_mb,
+                "usage_percent": round((1 - memory_available_mb / max(1, memory_total_mb)) * 100, 1)
             },
             "storage": {
                 "temp_space_gb": self.temp_space_available_gb
@@ -60,7 +68,7 @@ class HardwareInfo:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class OptimizationConfig:
     """基于硬件的优化配置"""
     # 转录优化配置
@@ -1,7 +1,7 @@
 """
 任务相关的数据模型定义
 """
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from typing import List, Dict, Optional
 import torch
 
@@ -38,6 +38,11 @@ class JobState:
 
     def to_dict(self):
         """转换为字典格式，用于API响应"""
-        d = asdict(self)
-        d.pop('segments', None)  # 不透出内部详情
-        return d
\ No newline at end of file
+        # 跳过 segments（不透出内部详情），避免 asdict 在每次状态轮询时深拷贝整个分段列表
+        d = {name: getattr(self, name) for name in _JOB_STATE_PUBLIC_FIELDS}
+        d['settings'] = asdict(self.settings)
+        return d
+
+
+# to_dict 输出的字段，模块加载时计算一次
+_JOB_STATE_PUBLIC_FIELDS = tuple(f.name for f in fields(JobState) if f.name != 'segments')
\ No newline at end of file
@@ -38,6 +38,10 @@ PHASE_WEIGHTS = {
 }
 TOTAL_WEIGHT = sum(PHASE_WEIGHTS.values())
 
+# 同时进行转录的任务数上限（默认 1，对应单块 GPU）；提取与分段阶段不受限制
+GPU_CONCURRENCY = max(1, int(os.getenv("VTS_GPU_CONCURRENCY", "1")))
+_gpu_slots = threading.BoundedSemaphore(GPU_CONCURRENCY)
+
 @dataclass
 class CPUAffinityConfig:
     """CPU亲和性配置类"""
@@ -53,6 +57,8 @@ class CPUAffinityManager:
         self.logger = logging.getLogger(__name__)
         self.original_affinity = None
         self.is_supported = psutil is not None and hasattr(psutil.Process(), 'cpu_affinity')
+        # CPU 拓扑在进程生命周期内不变，首次查询后缓存；亲和性仍每次实时读取
+        self._topology: Optional[Dict[str, any]] = None
         
         if not self.is_supported:
             self.logger.warning("CPU亲和性功能不可用：psutil未安装或系统不支持")
@@ -63,16 +69,20 @@ class CPUAffinityManager:
             return {"supported": False, "reason": "psutil not available"}
         
         try:
-            cpu_count = psutil.cpu_count(logical=True)   # 逻辑核心数
-            physical_count = psutil.cpu_count(logical=False)  # 物理核心数
+            if self._topology is None:
+                self._topology = {
+                    "logical_cores": psutil.cpu_count(logical=True),   # 逻辑核心数
+                    "physical_cores": psutil.cpu_count(logical=False),  # 物理核心数
+                    "platform": platform.system()
+                }
             current_affinity = psutil.Process().cpu_affinity()
             
             return {
                 "supported": True,
-                "logical_cores": cpu_count,
-                "physical_cores": physical_count,
+                "logical_cores": self._topology["logical_cores"],
+                "physical_cores": self._topology["physical_cores"],
                 "current_affinity": current_affinity,
-                "platform": platform.system()
+                "platform": self._topology["platform"]
             }
         except Exception as e:
             return {"supported": False, "error": str(e)}
@@ -303,6 +313,7 @@ class TranscriptionProcessor:
     def _run_pipeline(self, job: JobState):
         # 应用CPU亲和性设置
         cpu_applied = False
+        gpu_acquired = False
         if job.settings.cpu_affinity.enabled:
             cpu_applied = self.cpu_manager.apply_cpu_affinity(job.settings.cpu_affinity)
             if cpu_applied:
@@ -329,7 +340,12 @@ class TranscriptionProcessor:
             job.segments = segments
             job.total = len(segments)
             self._update_progress(job, 'split', 1, f'分段完成 共{job.total}段')
-            # 转录
+            # 转录：等待空闲的转录槽位，避免多个任务同时争抢 GPU；有空闲槽位时直接占用，不提示等待
+            if not _gpu_slots.acquire(blocking=False):
+                self._update_progress(job, 'transcribe', 0, '等待其他任务转录完成')
+                while not _gpu_slots.acquire(timeout=0.5):
+                    if job.canceled: raise RuntimeError('任务已取消')
+            gpu_acquired = True
             self._update_progress(job, 'transcribe', 0, '加载模型中')
             if job.canceled: raise RuntimeError('任务已取消')
             model = self._get_model(job.settings)
@@ -344,6 +360,8 @@ class TranscriptionProcessor:
                 if seg_result:
                     processed_results.append(seg_result)
                 job.processed = idx + 1
+            _gpu_slots.release()
+            gpu_acquired = False
             self._update_progress(job, 'transcribe', 1, '转录完成 生成字幕中')
             if job.canceled: raise RuntimeError('任务已取消')
             # 生成SRT
@@ -368,6 +386,8 @@ class TranscriptionProcessor:
                 job.error = str(e)
                 self.logger.error(f"任务 {job.job_id} 处理失败: {e}")
         finally:
+            if gpu_acquired:
+                _gpu_slots.release()
             # 恢复CPU亲和性设置
             if cpu_applied:
                 restored = self.cpu_manager.restore_cpu_affinity()
@@ -1,7 +1,24 @@
 """
 初始化服务包
+
+包内导出按需加载：transcription_service 会导入 whisperx / torch，
+仅导入 services.file_service 等轻量模块时不应连带加载。
 """
-from .transcription_service import TranscriptionService, get_transcription_service
-from .file_service import FileManagementService
+import importlib
+
+_EXPORTS = {
+    'TranscriptionService': '.transcription_service',
+    'get_transcription_service': '.transcription_service',
+    'FileManagementService': '.file_service',
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = ['TranscriptionService', 'get_transcription_service', 'FileManagementService']
\ No newline at end of file
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
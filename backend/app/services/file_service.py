@@ -2,10 +2,126 @@
 文件管理服务
 """
 import os
-from typing import List, Dict
+import shutil
+import logging
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 
+logger = logging.getLogger(__name__)
+
+
+# 支持的媒体扩展名，模块加载时构建一次
+MEDIA_EXTENSIONS = frozenset({
+    '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v',  # 视频
+    '.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma',  # 音频
+})
+
+
+def is_media_file(filename: str) -> bool:
+    """检查是否为支持的视频或音频文件，扩展名判定与 os.path.splitext 一致（".mp3"、"..mp3" 不算扩展名）"""
+    # 只取最后一个点之后的部分查表，代替 splitext + 两个集合的判断
+    head, _, ext = filename.rpartition('.')
+    return bool(head.lstrip('.')) and '.' + ext.lower() in MEDIA_EXTENSIONS
+
+
+def copy_if_changed(src: str, dst: str) -> bool:
+    """目标文件不存在或已过期时才复制，返回是否发生了复制"""
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+        if dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime >= src_stat.st_mtime:
+            return False
+    except FileNotFoundError:
+        pass
+    shutil.copy2(src, dst)
+    return True
+
+
+def link_or_copy(src: str, dst: str) -> bool:
+    """以硬链接同步文件，不复制数据；无法链接（跨文件系统、不支持硬链接等）时回退到 copy_if_changed
+
+    返回是否更新了目标文件。目标已是同一文件或已是最新副本时跳过。
+    """
+    src_stat = os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        dst_stat = None
+    if dst_stat is not None and (
+        os.path.samestat(src_stat, dst_stat)
+        or (dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime >= src_stat.st_mtime)
+    ):
+        return False
+    # 先链接到临时名再原子替换，已存在的旧副本不会出现中间状态
+    tmp_path = f"{dst}.{os.getpid()}.link"
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        return copy_if_changed(src, dst)
+    try:
+        os.replace(tmp_path, dst)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+
+def mirror_to_output(src: str, dst: str):
+    """将字幕文件同步一份到输出目录（后台任务，失败不影响下载），同一文件系统上使用硬链接"""
+    try:
+        link_or_copy(src, dst)
+    except Exception as e:
+        logger.warning("复制到输出目录失败: %s", e)
+
+
+def stat_or_none(path: str) -> Optional[os.stat_result]:
+    """返回文件的 stat 结果，文件不存在时返回 None"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+# 上传文件写盘的分块大小
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def save_upload_file(src_file, directory: str, filename: str) -> Tuple[str, str]:
+    """将上传的临时文件按块保存到 directory，同名文件自动加序号，返回 (文件名, 路径)
+
+    以 O_CREAT|O_EXCL 原子地创建目标文件，每次尝试只需一次系统调用，
+    并发上传同名文件时也不会互相覆盖；在不区分大小写的文件系统上仅大小写不同的文件名同样视为重名。
+    内存占用与文件大小无关。
+    """
+    base_name, ext = os.path.splitext(filename)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    counter = 1
+    while True:
+        dst_path = os.path.join(directory, filename)
+        try:
+            fd = os.open(dst_path, flags, 0o666)
+            break
+        except FileExistsError:
+            filename = f"{base_name}_{counter}{ext}"
+            counter += 1
+    with os.fdopen(fd, "wb") as buffer:
+        shutil.copyfileobj(src_file, buffer, UPLOAD_CHUNK_SIZE)
+    return filename, dst_path
+
+
+def ensure_dirs(base_dir: str, names) -> None:
+    """确保 base_dir 下的子目录存在：只列一次父目录，仅为缺失的目录调用 makedirs"""
+    try:
+        with os.scandir(base_dir) as it:
+            existing = {entry.name for entry in it if entry.is_dir()}
+    except FileNotFoundError:
+        existing = set()
+    for name in names:
+        if name not in existing:
+            os.makedirs(os.path.join(base_dir, name), exist_ok=True)
+
+
 class FileManagementService:
     """文件管理服务"""
     
@@ -18,25 +134,25 @@ class FileManagementService:
 
     def is_supported_file(self, filename: str) -> bool:
         """检查是否为支持的视频或音频文件"""
-        video_extensions = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
-        audio_extensions = {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma'}
-        ext = os.path.splitext(filename.lower())[1]
-        return ext in video_extensions or ext in audio_extensions
+        return is_media_file(filename)
 
     def list_input_files(self) -> List[Dict]:
         """获取输入目录中的所有媒体文件"""
         files = []
-        if os.path.exists(self.input_dir):
-            for filename in os.listdir(self.input_dir):
-                file_path = os.path.join(self.input_dir, filename)
-                if os.path.isfile(file_path) and self.is_supported_file(filename):
-                    stat = os.stat(file_path)
-                    files.append({
-                        'name': filename,
-                        'size': stat.st_size,
-                        'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                        'path': file_path
-                    })
+        try:
+            # scandir 一次读取目录项，is_file 不再额外 stat，只对媒体文件取 stat
+            with os.scandir(self.input_dir) as it:
+                for entry in it:
+                    if entry.is_file() and self.is_supported_file(entry.name):
+                        stat = entry.stat()
+                        files.append({
+                            'name': entry.name,
+                            'size': stat.st_size,
+                            'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                            'path': entry.path
+                        })
+        except FileNotFoundError:
+            pass
         
         # 按修改时间倒序排列
         files.sort(key=lambda x: x['modified'], reverse=True)
@@ -44,11 +160,13 @@ class FileManagementService:
 
     def delete_input_file(self, filename: str) -> bool:
         """删除输入目录中的文件"""
-        file_path = os.path.join(self.input_dir, filename)
-        if not os.path.exists(file_path):
+        # 只允许删除 input 目录下的直接子项，拒绝 ".." 等路径穿越
+        input_dir = os.path.realpath(self.input_dir)
+        file_path = os.path.normpath(os.path.join(input_dir, filename))
+        if os.path.dirname(file_path) != input_dir:
             return False
         try:
-            os.remove(file_path)
+            os.unlink(file_path)
             return True
         except Exception:
             return False
@@ -57,6 +175,10 @@ class FileManagementService:
         """获取输入文件的完整路径"""
         return os.path.join(self.input_dir, filename)
 
+    def save_input_file(self, src_file, filename: str) -> Tuple[str, str]:
+        """将上传文件保存到输入目录，同名文件自动加序号，返回 (文件名, 完整路径)"""
+        return save_upload_file(src_file, self.input_dir, filename)
+
     def get_output_file_path(self, filename: str) -> str:
         """获取输出文件的完整路径"""
         return os.path.join(self.output_dir, filename)
\ No newline at end of file
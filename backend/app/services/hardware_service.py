@@ -3,6 +3,7 @@
 """
 import os
 import shutil
+import platform
 import tempfile
 import logging
 from typing import List, Dict, Optional, Tuple
@@ -154,7 +155,6 @@ class CoreHardwareDetector:
                     cpu_info["cpu_max_frequency"] = cpu_freq.max
                     
                 # 在Windows上，尝试从注册表获取CPU名称
-                import platform
                 if platform.system() == "Windows":
                     try:
                         import winreg
@@ -10,8 +10,10 @@ import threading
 import time
 import asyncio
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Any
+import numpy as np
 import psutil
 import torch
 import whisperx
@@ -64,9 +66,13 @@ class ModelPreloadManager:
         # 模型缓存 (LRU)
         self._whisper_cache: OrderedDict[Tuple[str, str, str], ModelCacheInfo] = OrderedDict()
         self._align_cache: OrderedDict[str, Tuple[Any, Any, float]] = OrderedDict()
+        # 预加载的模型会被固定，LRU 驱逐和普通清理都不会移除
+        self._pinned: set = set()
         
         # 统一锁 - 简化并发控制，避免多锁死锁
         self._global_lock = threading.RLock()
+        # 正在加载中的 Whisper 模型：同一模型的其他请求等待该次加载完成，而不是重复加载
+        self._loading: Dict[Tuple[str, str, str], threading.Event] = {}
         
         # 简化的预加载状态 - 单一数据源
         self._preload_status = {
@@ -86,6 +92,9 @@ class ModelPreloadManager:
         # 预加载任务管理 - 实现幂等性
         self._preload_promise: Optional[asyncio.Task] = None
         
+        # 模型加载专用线程：加载串行执行，且不占用事件循环的默认线程池
+        self._load_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-load")
+        
         # 内存监控
         self._memory_monitor = MemoryMonitor()
         
@@ -167,6 +176,8 @@ class ModelPreloadManager:
         try:
             success_count = 0
             total_models = len(self.config.default_models)
+            # 上一个模型的预热任务：与下一个模型的磁盘加载并行执行
+            warmup_task: Optional[asyncio.Task] = None
             
             for i, model_name in enumerate(self.config.default_models):
                 try:
@@ -194,6 +205,7 @@ class ModelPreloadManager:
                     with self._global_lock:
                         if key in self._whisper_cache:
                             self.logger.info(f"✅ 模型 {model_name} 已在缓存中")
+                            self.pin(key)
                             self._preload_status["loaded_models"] += 1
                             success_count += 1
                             continue
@@ -208,14 +220,21 @@ class ModelPreloadManager:
                     self.logger.info(f"🔍 开始加载模型: {model_name} (device={device})")
                     start_time = time.time()
                     
-                    model = self._load_whisper_model(settings)
+                    # 加载与预热都是阻塞调用，放到线程中执行，避免阻塞事件循环
+                    model = await asyncio.get_running_loop().run_in_executor(
+                        self._load_executor, self._load_whisper_model, settings
+                    )
                     
                     load_time = time.time() - start_time
+                    self.pin(key)
                     
-                    # 预热模型
+                    # 预热模型：等待上一个模型预热结束后，在后台开始本模型的预热，
+                    # 循环随即进入下一个模型的加载，使磁盘 I/O 与 GPU 预热重叠
                     if self.config.warmup_enabled:
+                        if warmup_task is not None:
+                            await warmup_task
                         self.logger.info(f"🔥 预热模型: {model_name}")
-                        self._warmup_model(model)
+                        warmup_task = asyncio.create_task(self._timed_warmup(model_name, model))
                     
                     with self._global_lock:
                         self._preload_status["loaded_models"] += 1
@@ -234,6 +253,10 @@ class ModelPreloadManager:
                     with self._global_lock:
                         self._preload_status["errors"].append(error_msg)
             
+            # 等待最后一个模型预热完成
+            if warmup_task is not None:
+                await warmup_task
+            
             # 完成预加载
             success = success_count > 0
             
@@ -300,6 +323,16 @@ class ModelPreloadManager:
             
         self.logger.info(f"🔄 预加载失败计数已重置: {old_attempts} -> 0")
     
+    def pin(self, key: Tuple[str, str, str]):
+        """固定模型，使其不被 LRU 驱逐或普通清理移除"""
+        with self._global_lock:
+            self._pinned.add(key)
+    
+    def unpin(self, key: Tuple[str, str, str]):
+        """取消固定模型"""
+        with self._global_lock:
+            self._pinned.discard(key)
+    
     def get_model(self, settings: JobSettings):
         """获取Whisper模型 (带LRU缓存) - 简化版本"""
         key = (settings.model, settings.compute_type, settings.device)
@@ -313,24 +346,39 @@ class ModelPreloadManager:
                 self._whisper_cache.move_to_end(key)
                 self.logger.debug(f"✅ 命中模型缓存: {key}")
                 return info.model
-            
-            # 缓存未命中，加载新模型
-            self.logger.info(f"🔄 需要加载新模型: {key}")
-            return self._load_whisper_model(settings)
+        
+        # 缓存未命中，加载新模型；加载期间不持有全局锁，状态查询与预加载进度更新不会被阻塞
+        self.logger.info(f"🔄 需要加载新模型: {key}")
+        return self._load_whisper_model(settings)
     
     def _load_whisper_model(self, settings: JobSettings):
         """加载Whisper模型 - 简化版本带并发保护"""
         key = (settings.model, settings.compute_type, settings.device)
         
-        # 再次检查缓存（避免并发加载同一模型）
-        with self._global_lock:
-            if key in self._whisper_cache:
-                info = self._whisper_cache[key]
-                info.last_used = time.time()
-                self._whisper_cache.move_to_end(key)
-                self.logger.debug(f"⚡ 并发检查命中缓存，避免重复加载: {key}")
-                return info.model
+        # 再次检查缓存；同一模型正在加载时（如启动预加载）等待其完成，避免并发加载同一模型
+        while True:
+            with self._global_lock:
+                if key in self._whisper_cache:
+                    info = self._whisper_cache[key]
+                    info.last_used = time.time()
+                    self._whisper_cache.move_to_end(key)
+                    self.logger.debug(f"⚡ 并发检查命中缓存，避免重复加载: {key}")
+                    return info.model
+                loading = self._loading.get(key)
+                if loading is None:
+                    self._loading[key] = threading.Event()
+                    break
+            self.logger.info(f"⏳ 模型 {key} 正在加载中，等待完成")
+            loading.wait()
         
+        try:
+            return self._do_load_whisper_model(settings, key)
+        finally:
+            with self._global_lock:
+                self._loading.pop(key).set()
+    
+    def _do_load_whisper_model(self, settings: JobSettings, key: Tuple[str, str, str]):
+        """实际从磁盘加载 Whisper 模型并写入缓存"""
         self.logger.info(f"🔍 开始加载新Whisper模型: {key}")
         
         # 检查内存
@@ -414,18 +462,28 @@ class ModelPreloadManager:
                 self.logger.error(f"❌ 加载对齐模型失败 {lang}: {str(e)}", exc_info=True)
                 raise
     
+    async def _timed_warmup(self, model_name: str, model):
+        """在线程中预热模型并记录耗时"""
+        start_time = time.time()
+        await asyncio.to_thread(self._warmup_model, model)
+        self.logger.info(f"🔥 模型 {model_name} 预热完成 (耗时: {time.time() - start_time:.2f}s)")
+    
     def _warmup_model(self, model):
         """预热模型 - 空跑一次确保完全加载"""
         try:
             self.logger.debug("开始模型预热")
             
             # 创建虚拟音频数据 (1秒静音)
-            import numpy as np
             dummy_audio = np.zeros(16000, dtype=np.float32)  # 16kHz 1秒
             
             # 空跑一次
             _ = model.transcribe(dummy_audio, batch_size=1, verbose=False)
-            
+
+            # 等待 GPU 上的初始化与算法选择全部完成，并释放预热产生的临时显存
+            if torch.cuda.is_available():
+                torch.cuda.synchronize()
+                torch.cuda.empty_cache()
+
             self.logger.debug("模型预热完成")
             
         except Exception as e:
@@ -433,11 +491,12 @@ class ModelPreloadManager:
     
     def _evict_lru_model(self):
         """驱逐最久未使用的模型 - 需要在锁内调用"""
-        if not self._whisper_cache:
+        # 最久未使用的在开头，跳过已固定的模型
+        oldest_key = next((key for key in self._whisper_cache if key not in self._pinned), None)
+        if oldest_key is None:
+            if self._whisper_cache:
+                self.logger.warning(f"⚠️ 缓存模型均已固定，暂时超出缓存上限: {len(self._whisper_cache)}/{self.config.max_cache_size}")
             return
-        
-        # 最久未使用的在开头
-        oldest_key = next(iter(self._whisper_cache))
         info = self._whisper_cache.pop(oldest_key)
         
         self.logger.info(f"🗑️ 驱逐LRU模型: {oldest_key}, 释放内存: {info.memory_size}MB")
@@ -457,8 +516,8 @@ class ModelPreloadManager:
         
         with self._global_lock:
             for key, info in self._whisper_cache.items():
-                # 超过10分钟未使用的模型
-                if current_time - info.last_used > 600:
+                # 超过10分钟未使用且未固定的模型
+                if key not in self._pinned and current_time - info.last_used > 600:
                     to_remove.append(key)
             
             for key in to_remove:
@@ -489,25 +548,32 @@ class ModelPreloadManager:
         # 默认估算值
         return 500  # 默认500MB
     
-    def clear_cache(self):
-        """清空所有缓存 - 简化版本，立即同步状态"""
+    def clear_cache(self, force: bool = False):
+        """清空缓存 - 简化版本，立即同步状态
+        
+        默认保留已固定的预加载模型；force=True 时清空全部并取消固定。
+        """
         with self._global_lock:
+            if force:
+                self._pinned.clear()
+            to_remove = [key for key in self._whisper_cache if key not in self._pinned]
+            
             # 记录清理前的缓存状态
-            whisper_count = len(self._whisper_cache)
+            whisper_count = len(to_remove)
             align_count = len(self._align_cache)
-            total_memory = sum(info.memory_size for info in self._whisper_cache.values())
+            total_memory = sum(self._whisper_cache[key].memory_size for key in to_remove)
             
             # 清理Whisper模型缓存
-            for info in self._whisper_cache.values():
+            for key in to_remove:
+                info = self._whisper_cache.pop(key)
                 del info.model
-            self._whisper_cache.clear()
             
             # 清理对齐模型缓存
             self._align_cache.clear()
             
             # 立即更新预加载状态 - 解决状态同步问题
             self._preload_status.update({
-                "loaded_models": 0,
+                "loaded_models": len(self._whisper_cache),
                 "is_preloading": False,
                 "progress": 0.0,
                 "current_model": "",
@@ -520,7 +586,15 @@ class ModelPreloadManager:
         if torch.cuda.is_available():
             torch.cuda.empty_cache()
         
-        self.logger.info(f"🗑️ 已清空所有模型缓存: Whisper={whisper_count}个, 对齐={align_count}个, 释放内存={total_memory}MB")
+        self.logger.info(f"🗑️ 已清空模型缓存: Whisper={whisper_count}个 (保留固定={len(self._pinned)}个), 对齐={align_count}个, 释放内存={total_memory}MB")
+
+    async def clear_cache_serialized(self, force: bool = False):
+        """在模型加载线程中清空缓存，与进行中的加载串行执行，避免清理与加载交错"""
+        await asyncio.get_running_loop().run_in_executor(self._load_executor, self.clear_cache, force)
+
+    def shutdown(self):
+        """关闭模型加载线程，不等待进行中的加载"""
+        self._load_executor.shutdown(wait=False, cancel_futures=True)
 
 
 class MemoryMonitor:
@@ -125,8 +125,8 @@ class TranscriptionService:
 
     def get_job(self, job_id: str) -> Optional[JobState]:
         """获取任务状态"""
-        with self.lock:
-            return self.jobs.get(job_id)
+        # dict.get 在 GIL 下是原子操作，读路径无需加锁；写入（create_job）仍持有 self.lock
+        return self.jobs.get(job_id)
 
     def start_job(self, job_id: str):
         """启动转录任务"""